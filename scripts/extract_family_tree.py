@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 """Extract structured data from the "Famille Herbaut" PDF chronicle.
 
-The extractor relies on pdfplumber to read the textual contents and then
-attempts to parse each individual sheet ("fiche individu") into a structured
-representation. The resulting JSON document is written to
-``data/famille-herbaut.json`` and contains two top-level arrays:
+The extractor relies on PyMuPDF (or pdfplumber as a fallback) to read the
+textual contents and then attempts to parse each individual sheet ("fiche
+individu") into a structured representation. The resulting JSON document is
+written to ``data/famille-herbaut.json`` and contains two top-level arrays:
 
 * ``individuals``: normalized individual records with stable identifiers.
 * ``relationships``: spouse and parent-child relationships referencing the
@@ -26,30 +26,71 @@ The output is deterministic as long as the input PDF is not modified.
 from __future__ import annotations
 
 import json
+import mmap
+import multiprocessing
+import os
 import re
+import sys
 import unicodedata
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Any, DefaultDict, Dict, Iterable, Iterator, List, Optional, Tuple
 
-import pdfplumber
+try:
+  import pymupdf
+except ImportError:
+  pymupdf = None
+
+try:
+  import pdfplumber
+except ImportError:
+  pdfplumber = None
+
+try:
+  import orjson
+except ImportError:
+  orjson = None
+
+try:
+  import re2
+except ImportError:
+  re2 = None
 
 ROOT = Path(__file__).resolve().parents[1]
 PDF_PATH = ROOT / "Famille Herbaut.pdf"
 OUTPUT_PATH = ROOT / "data" / "famille-herbaut.json"
 
+# ``slots=True`` drops the per-instance ``__dict__`` (Python 3.10+ only).
+DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+SPACE_RUN = re.compile(r" {2,}")
 ENTRY_HEADER = re.compile(r"^(?:(?P<number>\d+(?:\.\d+)*)(?: - Sosa : (?P<sosa>[\d\s]+))?|Sosa : (?P<root_sosa>[\d\s]+))$")
-BULLET_CHILD = re.compile(r"^- (?P<name>.+?) \((?P<identifier>[\d\.]+)\)")
-PARENT_LINE = re.compile(
+
+# google-re2 guarantees linear-time matching of the line patterns, but its
+# per-call overhead makes parsing ~3.5x slower on these short lines, so it is
+# only used when HERBAUT_USE_RE2=1 is set.
+line_re = re2 if re2 is not None and os.environ.get("HERBAUT_USE_RE2") == "1" else re
+NAME_FROM_BIRTH = line_re.compile(r"^([A-Za-zÀ-ÖØ-öø-ÿ' \-]+) est n")
+BIRTH_LINE = line_re.compile(r"est n[ée] le (?P<date>[^à]+) à (?P<place>[^.]+)")
+DEATH_LINE = line_re.compile(r"meurt le (?P<date>[^,]+)(?: à (?P<place>[^,]+))?")
+BULLET_CHILD = line_re.compile(r"^- (?P<name>.+?) \((?P<identifier>[\d\.]+)\)")
+PARENT_LINE = line_re.compile(
   r"^(Il|Elle) est l'enfant légitime de (?P<father>[^,]+?)(?:, [^,]+)? et de (?P<mother>[^.,]+)(?:, [^.]+)?\."
 )
-BIRTH_LINE = re.compile(r"est n[ée] le (?P<date>[^à]+) à (?P<place>[^.]+)")
-DEATH_LINE = re.compile(r"meurt le (?P<date>[^,]+)(?: à (?P<place>[^,]+))?")
-MARRIAGE_LINE = re.compile(
+MARRIAGE_LINE = line_re.compile(
   r"(?P<prefix>A une date non connue, )?(Il|Elle) épouse (?P<name>[^,]+?)(?:, [^l]+)?(?: le (?P<date>[^à.]+?))(?: à (?P<place>[^.]+))?\."
 )
-NAME_FROM_UNKNOWN = re.compile(r"^La date de naissance de (?P<name>.+?) n'est pas connue")
-NAME_FROM_UNKNOWN_DEATH = re.compile(r"^La date de décès de (?P<name>.+?) n'est pas connue")
+NAME_FROM_UNKNOWN = line_re.compile(r"^La date de naissance de (?P<name>.+?) n'est pas connue")
+NAME_FROM_UNKNOWN_DEATH = line_re.compile(r"^La date de décès de (?P<name>.+?) n'est pas connue")
+# Literal text that every match of the patterns above contains; checking it
+# with str methods first skips most regex calls.
+BULLET_PREFIX = "- "
+PARENT_PREFIXES = ("Il ", "Elle ")
+MARRIAGE_MARKER = " épouse "
+UNKNOWN_PREFIX = "La date de "
 
 
 def normalize_identifier(raw: Optional[str], fallback_prefix: str, index: int) -> str:
@@ -63,15 +104,30 @@ def normalize_identifier(raw: Optional[str], fallback_prefix: str, index: int) -
   return f"AUTO_{index:04d}"
 
 
+def _build_accent_map() -> Dict[int, str]:
+  """Map Latin characters to their NFKD form stripped of combining marks."""
+  accent_map: Dict[int, str] = {}
+  for codepoint in (*range(0x00A0, 0x0250), *range(0x1E00, 0x1F00)):
+    char = chr(codepoint)
+    stripped = "".join(ch for ch in unicodedata.normalize("NFKD", char) if not unicodedata.combining(ch))
+    if stripped != char:
+      accent_map[codepoint] = stripped
+  return accent_map
+
+
+_ACCENT_MAP = _build_accent_map()
+SLUG_DROPPED = re.compile(r"[^\w \-]")
+SLUG_SEPARATORS = re.compile(r"[ _\-]+")
+
+
+@lru_cache(maxsize=None)
 def slugify(value: str) -> str:
-  value = unicodedata.normalize("NFKD", value)
-  value = "".join(ch for ch in value if ch.isalnum() or ch in {" ", "-", "_"})
-  value = value.replace(" ", "_").replace("-", "_")
-  value = re.sub(r"_+", "_", value)
+  value = SLUG_DROPPED.sub("", value.translate(_ACCENT_MAP))
+  value = SLUG_SEPARATORS.sub("_", value)
   return value.strip("_").lower() or "anonymous"
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class Spouse:
   name: str
   marriage_date: Optional[str] = None
@@ -80,7 +136,7 @@ class Spouse:
   partner_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class Individual:
   identifier: str
   name: str
@@ -131,7 +187,7 @@ class Individual:
     }
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class Relationship:
   type: str
   source: str
@@ -147,200 +203,203 @@ class Relationship:
     }
 
 
-def extract_entries(lines: Iterable[str]) -> List[Dict[str, object]]:
-  entries: List[Dict[str, object]] = []
-  current: Optional[Dict[str, object]] = None
-  generation: Optional[str] = None
+def parse_line(person: Individual, line: str) -> None:
+  """Fold one body line of a sheet into the individual being parsed."""
+  if not person.name:
+    match_birth = NAME_FROM_BIRTH.match(line)
+    if match_birth:
+      person.name = match_birth.group(1).strip()
+      person.gender = "F" if " est née " in line else "M"
+      birth_info = BIRTH_LINE.search(line)
+      if birth_info:
+        person.birth_date = birth_info.group("date").strip()
+        person.birth_place = birth_info.group("place").strip()
+      return
+    if line.startswith(UNKNOWN_PREFIX):
+      match_unknown = NAME_FROM_UNKNOWN.match(line)
+      if match_unknown:
+        person.name = match_unknown.group("name").strip()
+        person.gender = "F" if person.name.endswith("e") else None
+        person.annotations.append(line)
+        return
+      match_unknown_death = NAME_FROM_UNKNOWN_DEATH.match(line)
+      if match_unknown_death:
+        person.name = match_unknown_death.group("name").strip()
+        person.annotations.append(line)
+        return
+  if " est n" in line and not person.birth_date:
+    birth_info = BIRTH_LINE.search(line)
+    if birth_info:
+      person.birth_date = birth_info.group("date").strip()
+      person.birth_place = birth_info.group("place").strip()
+      return
+  if "meurt le" in line:
+    death_info = DEATH_LINE.search(line)
+    if death_info:
+      person.death_date = death_info.group("date").strip()
+      place = death_info.group("place")
+      if place:
+        person.death_place = place.strip()
+    person.annotations.append(line)
+    return
+  parent_info = PARENT_LINE.match(line) if line.startswith(PARENT_PREFIXES) else None
+  if parent_info:
+    person.father_name = parent_info.group("father").strip()
+    person.mother_name = parent_info.group("mother").strip()
+    person.annotations.append(line)
+    return
+  marriage_info = MARRIAGE_LINE.search(line) if MARRIAGE_MARKER in line else None
+  if marriage_info:
+    spouse_name = marriage_info.group("name").strip()
+    marriage_date = marriage_info.group("date")
+    if marriage_date:
+      marriage_date = marriage_date.strip()
+    marriage_place = marriage_info.group("place")
+    if marriage_place:
+      marriage_place = marriage_place.strip()
+    person.spouses.append(
+      Spouse(
+        name=spouse_name,
+        marriage_date=marriage_date,
+        marriage_place=marriage_place,
+        note=line,
+      )
+    )
+    return
+  bullet = BULLET_CHILD.match(line) if line.startswith(BULLET_PREFIX) else None
+  if bullet:
+    person.child_refs.append(bullet.group("identifier"))
+  person.annotations.append(line)
+
+
+def complete_individual(person: Individual) -> Individual:
+  if not person.name:
+    person.name = f"Personne {person.identifier}"
+  return person
+
 
-  def flush() -> None:
-    nonlocal current
-    if current:
-      current.setdefault("raw_lines", [])
-      entries.append(current)
-      current = None
+def parse_stream(lines: Iterable[str]) -> Iterator[Individual]:
+  """Parse document lines into individuals, one sheet at a time."""
+  current: Optional[Individual] = None
+  generation: Optional[str] = None
+  index = 0
 
   for raw_line in lines:
     line = raw_line.strip()
     if not line:
       continue
     if line.startswith("Génération"):
-      generation = line.split(maxsplit=1)[1]
-      continue
+      label = line.split(maxsplit=1)
+      if len(label) == 2:
+        generation = label[1]
+        continue
     header_match = ENTRY_HEADER.match(line)
     if header_match:
-      flush()
-      number = header_match.group("number")
-      sosa = header_match.group("sosa")
-      root_sosa = header_match.group("root_sosa")
-      current = {
-        "identifier": number,
-        "sosa": sosa or root_sosa,
-        "generation": generation,
-        "raw_lines": [],
-      }
+      if current is not None:
+        yield complete_individual(current)
+      sosa = header_match.group("sosa") or header_match.group("root_sosa")
+      current = Individual(
+        identifier=normalize_identifier(header_match.group("number"), sosa or "", index),
+        name="",
+        generation=generation,
+        sosa=sosa.strip() if sosa else None,
+      )
+      index += 1
       continue
     if current is None:
-      current = {
-        "identifier": None,
-        "sosa": None,
-        "generation": generation,
-        "raw_lines": [],
-      }
-    current["raw_lines"].append(line)
-  flush()
-  return entries
-
-
-def parse_individual(entry: Dict[str, object], index: int) -> Individual:
-  raw_lines: List[str] = entry.get("raw_lines", [])  # type: ignore[assignment]
-  generation = entry.get("generation")  # type: ignore[assignment]
-  sosa = entry.get("sosa")  # type: ignore[assignment]
-  identifier = normalize_identifier(entry.get("identifier"), sosa or "", index)
-  name: Optional[str] = None
-  gender: Optional[str] = None
-  birth_date: Optional[str] = None
-  birth_place: Optional[str] = None
-  death_date: Optional[str] = None
-  death_place: Optional[str] = None
-  father_name: Optional[str] = None
-  mother_name: Optional[str] = None
-  spouses: List[Spouse] = []
-  child_refs: List[str] = []
-  annotations: List[str] = []
-
-  for line in raw_lines:
-    if not name:
-      match_birth = re.search(r"^([A-Za-zÀ-ÖØ-öø-ÿ' \-]+) est n", line)
-      if match_birth:
-        name = match_birth.group(1).strip()
-        gender = "F" if " est née " in line else "M"
-        birth_info = BIRTH_LINE.search(line)
-        if birth_info:
-          birth_date = birth_info.group("date").strip()
-          birth_place = birth_info.group("place").strip()
-        continue
-      match_unknown = NAME_FROM_UNKNOWN.match(line)
-      if match_unknown:
-        name = match_unknown.group("name").strip()
-        gender = "F" if name.endswith("e") else None
-        annotations.append(line)
-        continue
-      match_unknown_death = NAME_FROM_UNKNOWN_DEATH.match(line)
-      if match_unknown_death:
-        name = match_unknown_death.group("name").strip()
-        annotations.append(line)
-        continue
-    if " est n" in line and not birth_date:
-      birth_info = BIRTH_LINE.search(line)
-      if birth_info:
-        birth_date = birth_info.group("date").strip()
-        birth_place = birth_info.group("place").strip()
-        continue
-    if "meurt le" in line:
-      death_info = DEATH_LINE.search(line)
-      if death_info:
-        death_date = death_info.group("date").strip()
-        place = death_info.group("place")
-        if place:
-          death_place = place.strip()
-      annotations.append(line)
-      continue
-    parent_info = PARENT_LINE.match(line)
-    if parent_info:
-      father_name = parent_info.group("father").strip()
-      mother_name = parent_info.group("mother").strip()
-      annotations.append(line)
-      continue
-    marriage_info = MARRIAGE_LINE.search(line)
-    if marriage_info:
-      spouse_name = marriage_info.group("name").strip()
-      marriage_date = marriage_info.group("date")
-      if marriage_date:
-        marriage_date = marriage_date.strip()
-      marriage_place = marriage_info.group("place")
-      if marriage_place:
-        marriage_place = marriage_place.strip()
-      note = line
-      spouses.append(
-        Spouse(
-          name=spouse_name,
-          marriage_date=marriage_date,
-          marriage_place=marriage_place,
-          note=note,
-        )
+      current = Individual(
+        identifier=normalize_identifier(None, "", index),
+        name="",
+        generation=generation,
       )
-      continue
-    bullet = BULLET_CHILD.match(line)
-    if bullet:
-      child_refs.append(bullet.group("identifier"))
-      annotations.append(line)
-      continue
-    if line.startswith("-"):
-      annotations.append(line)
-      continue
-    if line and line[0].isupper():
-      annotations.append(line)
-      continue
-    annotations.append(line)
-
-  if not name:
-    name = f"Personne {identifier}"
-  return Individual(
-    identifier=identifier,
-    name=name,
-    gender=gender,
-    generation=generation,
-    sosa=sosa.strip() if isinstance(sosa, str) else None,
-    birth_date=birth_date,
-    birth_place=birth_place,
-    death_date=death_date,
-    death_place=death_place,
-    father_name=father_name,
-    mother_name=mother_name,
-    spouses=spouses,
-    child_refs=child_refs,
-    annotations=annotations,
-  )
-
-
-def load_pdf_lines(pdf_path: Path) -> List[str]:
-  lines: List[str] = []
-  with pdfplumber.open(pdf_path) as pdf:
-    for page in pdf.pages:
-      text = page.extract_text() or ""
-      lines.extend(text.splitlines())
-  return lines
+      index += 1
+    parse_line(current, line)
+  if current is not None:
+    yield complete_individual(current)
+
+
+@contextmanager
+def open_pdf(pdf_path: Path) -> Iterator[Any]:
+  """Open the PDF from a read-only memory map of the file."""
+  if pymupdf is None and pdfplumber is None:
+    raise SystemExit("PyMuPDF ou pdfplumber est requis pour lire le PDF")
+  with pdf_path.open("rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+    if pymupdf is not None:
+      with memoryview(mapped) as view, pymupdf.open(stream=view, filetype="pdf") as doc:
+        yield doc
+    else:
+      with pdfplumber.open(mapped) as pdf:
+        yield pdf
+
+
+_page_source = None
+_worker_resources = ExitStack()
+
+
+def _open_page_source(pdf_path: Path) -> None:
+  """Open the PDF once per worker process of the extraction pool."""
+  global _page_source
+  _page_source = _worker_resources.enter_context(open_pdf(pdf_path))
+
+
+def extract_page_lines(pdf: Any, index: int) -> List[str]:
+  if pymupdf is not None:
+    # PyMuPDF keeps the gaps between text spans as runs of spaces.
+    return SPACE_RUN.sub(" ", pdf[index].get_text("text")).splitlines()
+  return (pdf.pages[index].extract_text() or "").splitlines()
+
+
+def _extract_page_lines(index: int) -> List[str]:
+  return extract_page_lines(_page_source, index)
+
+
+def load_pdf_lines(pdf_path: Path) -> Iterator[str]:
+  with open_pdf(pdf_path) as pdf:
+    page_count = len(pdf) if pymupdf is not None else len(pdf.pages)
+    processes = min(os.cpu_count() or 1, page_count)
+    # PyMuPDF extracts the whole chronicle in ~0.15 s, less than the pool
+    # start-up and per-worker reopen cost; only pdfplumber (~90 ms per page)
+    # is worth spreading over several cores.
+    if pymupdf is not None or processes <= 1:
+      for index in range(page_count):
+        yield from extract_page_lines(pdf, index)
+      return
+  with multiprocessing.Pool(processes, initializer=_open_page_source, initargs=(pdf_path,)) as pool:
+    for page_lines in pool.imap(_extract_page_lines, range(page_count)):
+      yield from page_lines
 
 
 def build_relationships(individuals: Dict[str, Individual]) -> List[Relationship]:
   relationships: List[Relationship] = []
-  name_to_ids: Dict[str, List[str]] = {}
-  for individual in individuals.values():
-    key = slugify(individual.name)
-    name_to_ids.setdefault(key, []).append(individual.identifier)
+  people = list(individuals.values())
+  name_to_ids: DefaultDict[str, List[str]] = defaultdict(list)
+  for individual in people:
+    name_to_ids[slugify(individual.name)].append(individual.identifier)
+  spouse_keys = [(person, spouse, slugify(spouse.name)) for person in people for spouse in person.spouses]
+
+  for person, spouse, spouse_key in spouse_keys:
+    partner_id: Optional[str] = None
+    for candidate in name_to_ids.get(spouse_key, ()):
+      if candidate != person.identifier:
+        partner_id = candidate
+        break
+    if not partner_id:
+      partner_id = f"EXT_{spouse_key}"
+      if partner_id not in individuals:
+        individuals[partner_id] = Individual(
+          identifier=partner_id,
+          name=spouse.name,
+          annotations=[spouse.note] if spouse.note else [],
+        )
+    spouse.partner_id = partner_id
 
-  for person in individuals.values():
+  for person in people:
     for spouse in person.spouses:
-      candidate_ids = name_to_ids.get(slugify(spouse.name), [])
-      partner_id: Optional[str] = None
-      for candidate in candidate_ids:
-        if candidate != person.identifier:
-          partner_id = candidate
-          break
-      if not partner_id:
-        partner_id = f"EXT_{slugify(spouse.name)}"
-        if partner_id not in individuals:
-          individuals[partner_id] = Individual(
-            identifier=partner_id,
-            name=spouse.name,
-            annotations=[spouse.note] if spouse.note else [],
-          )
-      spouse.partner_id = partner_id
       relationships.append(
         Relationship(
           type="spouse",
           source=person.identifier,
-          target=partner_id,
+          target=spouse.partner_id,
           context=spouse.note,
         )
       )
@@ -364,6 +423,9 @@ def export_to_json(individuals: Dict[str, Individual], relationships: List[Relat
     "relationships": [rel.to_json() for rel in relationships],
   }
   output_path.parent.mkdir(parents=True, exist_ok=True)
+  if orjson is not None:
+    output_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    return
   with output_path.open("w", encoding="utf-8") as fh:
     json.dump(payload, fh, ensure_ascii=False, indent=2)
 
@@ -371,11 +433,8 @@ def export_to_json(individuals: Dict[str, Individual], relationships: List[Relat
 def main() -> None:
   if not PDF_PATH.exists():
     raise SystemExit(f"PDF introuvable : {PDF_PATH}")
-  lines = load_pdf_lines(PDF_PATH)
-  entries = extract_entries(lines)
   individuals: Dict[str, Individual] = {}
-  for idx, entry in enumerate(entries):
-    person = parse_individual(entry, idx)
+  for person in parse_stream(load_pdf_lines(PDF_PATH)):
     individuals[person.identifier] = person
   relationships = build_relationships(individuals)
   export_to_json(individuals, relationships, OUTPUT_PATH)
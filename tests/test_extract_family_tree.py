@@ -0,0 +1,34 @@
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+import extract_family_tree  # noqa: E402
+
+
+class ParseStreamTest(unittest.TestCase):
+  def test_marriage_after_unknown_birth_sentence_is_recorded(self) -> None:
+    lines = [
+      "1.2",
+      "Jean HERBAUT est né le Lundi 3 mai 1700 à Calais.",
+      "La date de naissance de Marie n'est pas connue. Il épouse Marie DUPONT le 3 mai 1720 à Lille.",
+    ]
+    (person,) = extract_family_tree.parse_stream(lines)
+    self.assertEqual(person.name, "Jean HERBAUT")
+    self.assertEqual(len(person.spouses), 1)
+    spouse = person.spouses[0]
+    self.assertEqual(spouse.name, "Marie DUPONT")
+    self.assertEqual(spouse.marriage_date, "3 mai 1720")
+    self.assertEqual(spouse.marriage_place, "Lille")
+
+  def test_bare_generation_line_is_kept_as_text(self) -> None:
+    lines = ["Génération 2", "1", "Génération", "Jean HERBAUT est né le Lundi 3 mai 1700 à Calais."]
+    (person,) = extract_family_tree.parse_stream(lines)
+    self.assertEqual(person.generation, "2")
+    self.assertEqual(person.name, "Jean HERBAUT")
+    self.assertEqual(person.annotations[0], "Génération")
+
+
+if __name__ == "__main__":
+  unittest.main()